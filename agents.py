@@ -3,6 +3,8 @@ AI Agents module for Social Media AI Agent
 Integrates with Google Gemini API for real content generation
 """
 
+import asyncio
+import threading
 import time
 import random
 import requests
@@ -16,35 +18,89 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class TokenBucket:
+    """
+    Simple token-bucket rate limiter for the Gemini free tier
+
+    Proactively waits for a free slot instead of calling the API and
+    backing off on 429 responses, so no quota is wasted on rejected calls.
+    """
+
+    def __init__(self, rpm: int = 14):
+        self.rpm = rpm
+        self.tokens = float(rpm)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request slot is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Refill at rpm tokens per 60 seconds, capped at the burst size
+                self.tokens = min(float(self.rpm), self.tokens + (now - self.updated_at) * self.rpm / 60.0)
+                self.updated_at = now
+
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+
+                wait_time = (1.0 - self.tokens) * 60.0 / self.rpm
+
+            logger.info(f"Rate limit reached, waiting {wait_time:.1f}s for a free slot...")
+            time.sleep(wait_time)
+
+# Shared limiter for all agents, kept just under the 15 RPM free-tier ceiling
+_rate_limiter = TokenBucket(rpm=14)
+
+# Marker present in every fallback response so callers can tell a failed
+# call apart from real generated content (e.g. to avoid caching it)
+FALLBACK_MARKER = "Content generation temporarily unavailable"
+
 class GeminiLlmAgent:
     """
     Real LLM Agent using Google Gemini API
     """
     
-    def __init__(self, name: str, model: str, description: str, instruction: str, 
-                 tools: List = None, sub_agents: List = None):
+    def __init__(self, name: str, model: str, description: str, instruction: str,
+                 tools: List = None, sub_agents: List = None, full_package: bool = False):
         self.name = name
         self.model = model or "gemini-1.5-flash"
         self.description = description
         self.instruction = instruction
         self.tools = tools or []
         self.sub_agents = sub_agents or []
+        # Only agents producing a complete package get the six-section
+        # format scaffold; task-scoped agents answer just their section
+        self.full_package = full_package
         self.api_key = os.getenv('GOOGLE_API_KEY')
         
     def run(self, prompt: str) -> str:
         """Run the agent using Google Gemini API"""
         if not self.api_key:
             return self._fallback_response(prompt)
-        
+
         try:
             return self._call_gemini_api(prompt)
         except Exception as e:
             logger.error(f"Gemini API call failed: {str(e)}")
             return self._fallback_response(prompt)
-    
-    def _call_gemini_api(self, prompt: str) -> str:
-        """Call Google Gemini API"""
-        
+
+    def run_stream(self, prompt: str):
+        """Run the agent, yielding response chunks as they arrive"""
+        if not self.api_key:
+            yield self._fallback_response(prompt)
+            return
+
+        try:
+            yield from self._stream_gemini_api(prompt)
+        except Exception as e:
+            logger.error(f"Gemini streaming call failed: {str(e)}")
+            yield self._fallback_response(prompt)
+
+    def _request_payload(self, prompt: str) -> Dict[str, Any]:
+        """Build the Gemini request body for a prompt"""
+
         # Construct the full prompt with agent instructions
         full_prompt = f"""You are {self.name}, a specialized AI agent for social media content creation.
 
@@ -54,13 +110,16 @@ Instructions: {self.instruction}
 
 User Request:
 {prompt}
+"""
 
+        if self.full_package:
+            full_prompt += """
 Please generate comprehensive social media content that directly addresses the user's specific topic, platform, and tone requirements. Make sure the content is original, engaging, and optimized for the specified platform.
 
 Format your response as:
 ## 📊 CONTENT PACKAGE SUMMARY
 - **Topic**: [extracted topic]
-- **Platform**: [extracted platform] 
+- **Platform**: [extracted platform]
 - **Strategy**: [brief strategy description]
 
 ## 📝 CONTENT
@@ -77,16 +136,13 @@ Format your response as:
 
 ## 🔥 TRENDING ELEMENTS
 [Current trends related to the topic]
+"""
+        else:
+            full_prompt += """
+Make sure the content is original, engaging, and optimized for the specified platform. Follow the task instructions in the user request exactly and respond with only the requested section - do not add other sections or headers.
 """
 
-        # Gemini API endpoint
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
-        
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        data = {
+        return {
             "contents": [{
                 "parts": [{
                     "text": full_prompt
@@ -117,9 +173,22 @@ Format your response as:
                 }
             ]
         }
-        
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
+
+    def _call_gemini_api(self, prompt: str) -> str:
+        """Call Google Gemini API"""
+
+        # Gemini API endpoint
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
+
+        headers = {
+            "Content-Type": "application/json"
+        }
+
+        # Wait for a rate-limit slot before spending the API call
+        _rate_limiter.acquire()
+
+        response = requests.post(url, headers=headers, json=self._request_payload(prompt), timeout=30)
+
         if response.status_code == 200:
             result = response.json()
             if 'candidates' in result and len(result['candidates']) > 0:
@@ -130,11 +199,46 @@ Format your response as:
         else:
             error_msg = f"API call failed with status {response.status_code}: {response.text}"
             raise Exception(error_msg)
-    
+
+    def _stream_gemini_api(self, prompt: str):
+        """Call Google Gemini API in streaming mode, yielding text chunks"""
+
+        # Server-sent-events streaming endpoint
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:streamGenerateContent?alt=sse&key={self.api_key}"
+
+        headers = {
+            "Content-Type": "application/json"
+        }
+
+        # Wait for a rate-limit slot before spending the API call
+        _rate_limiter.acquire()
+
+        with requests.post(url, headers=headers, json=self._request_payload(prompt),
+                           timeout=60, stream=True) as response:
+            if response.status_code != 200:
+                error_msg = f"Streaming API call failed with status {response.status_code}: {response.text}"
+                raise Exception(error_msg)
+
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+
+                payload = line[len("data: "):]
+                if payload == "[DONE]":
+                    break
+
+                chunk = json.loads(payload)
+                candidates = chunk.get("candidates", [])
+                if candidates:
+                    for part in candidates[0].get("content", {}).get("parts", []):
+                        text = part.get("text")
+                        if text:
+                            yield text
+
     def _fallback_response(self, prompt: str) -> str:
         """Fallback response when API is not available"""
         return f"""## 📊 CONTENT PACKAGE SUMMARY
-- **Topic**: Content generation temporarily unavailable
+- **Topic**: {FALLBACK_MARKER}
 - **Platform**: General
 - **Strategy**: Using fallback response
 
@@ -268,6 +372,7 @@ Provide practical hashtag mixes that balance reach and engagement."""
             self.agents["coordinator"] = GeminiLlmAgent(
                 name="Social Media Coordinator",
                 model="gemini-1.5-flash",  # Changed to free model
+                full_package=True,
                 description="Coordinates social media content creation using specialized expertise",
                 instruction="""You are the Social Media Genius, an expert coordinator for comprehensive social media content creation.
 
@@ -295,6 +400,38 @@ Always create original content that matches the user's specific requirements. Ne
             logger.error(f"Error initializing agents: {str(e)}")
             raise
     
+    async def _run_agents_async(self, tasks: Dict[str, str]) -> Dict[str, str]:
+        """Run several agent prompts concurrently with bounded concurrency"""
+        semaphore = asyncio.Semaphore(8)
+
+        async def run_one(agent_name: str, prompt: str) -> str:
+            agent = self.agents[agent_name]
+            async with semaphore:
+                # The agents call the REST API via requests, so run them in
+                # worker threads to get real concurrency
+                return await asyncio.to_thread(agent.run, prompt)
+
+        responses = await asyncio.gather(
+            *(run_one(name, prompt) for name, prompt in tasks.items())
+        )
+        return dict(zip(tasks.keys(), responses))
+
+    def run_parallel(self, tasks: Dict[str, str]) -> Dict[str, str]:
+        """
+        Run multiple agents concurrently and collect their responses
+
+        Args:
+            tasks: Mapping of agent name -> prompt for that agent
+
+        Returns:
+            Mapping of agent name -> generated response
+        """
+        if not tasks:
+            return {}
+
+        logger.info(f"Dispatching {len(tasks)} agent calls concurrently...")
+        return asyncio.run(self._run_agents_async(tasks))
+
     def get_agent(self, agent_name: str) -> Optional[GeminiLlmAgent]:
         """Get a specific agent by name"""
         return self.agents.get(agent_name)
@@ -1,14 +1,18 @@
+from __future__ import annotations
+
 import streamlit as st
-import os
-import json
-import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agents import AgentManager
 
-# Import our simplified modules
+# Import our simplified modules (the heavy agents module is loaded lazily
+# inside _load_agent_manager to keep cold starts fast)
 try:
     from config import Config
-    from agents import get_agent_manager, AgentManager
     from utils import (
         validate_input, clean_text, format_hashtags, truncate_text,
         generate_content_id, format_timestamp, export_content_json,
@@ -29,6 +33,223 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Custom CSS, injected once per process via _inject_css
+_CSS = """
+    .main-header {
+        font-size: 3rem;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 2rem;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+
+    .agent-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 1.5rem;
+        border-radius: 15px;
+        color: white;
+        margin: 1rem 0;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+    }
+
+    .result-card {
+        background: #f8f9fa;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 4px solid #667eea;
+        margin: 1rem 0;
+    }
+
+    .metrics-container {
+        display: flex;
+        justify-content: space-around;
+        margin: 2rem 0;
+    }
+
+    .metric-item {
+        text-align: center;
+        padding: 1rem;
+    }
+
+    .stAlert > div {
+        padding: 1rem;
+        border-radius: 8px;
+    }
+"""
+
+def _sep() -> None:
+    """Horizontal separator; native st.divider skips the markdown parse"""
+    st.divider()
+
+@st.cache_resource
+def _inject_css() -> None:
+    """Inject the custom CSS once; cached reruns replay the element cheaply"""
+    st.markdown(f"<style>{_CSS}</style>", unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner="🤖 Initializing AI agents...")
+def _load_agent_manager(model: str, temperature: float, top_p: float,
+                        max_tokens: int) -> AgentManager:
+    """
+    Build the agent manager once per server process and share it across sessions
+
+    Keyed on the model configuration so a config change rebuilds the agents
+    instead of serving stale clients.
+    """
+    # Construct directly: the module-global singleton would defeat the
+    # cache key and keep serving agents built for the old configuration
+    from agents import AgentManager
+    return AgentManager()
+
+def _manager() -> AgentManager:
+    """Resolve the cached agent manager for the current configuration"""
+    return _load_agent_manager(
+        Config.DEFAULT_MODEL, Config.TEMPERATURE, Config.TOP_P, Config.MAX_TOKENS
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_test_gemini() -> Dict:
+    """Test the Gemini API connection, reusing the result for rapid reruns"""
+    from agents import test_gemini_connection
+    return test_gemini_connection()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_validate_config(key_fingerprint: str) -> Dict[str, bool]:
+    """Validate configuration, keyed on the API key so config changes invalidate"""
+    return Config.validate_config()
+
+def _config_fingerprint(api_key: Optional[str]) -> str:
+    """Build a cache key from the API key without exposing the key itself"""
+    import hashlib
+    return hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+
+# Shared request brief sent to every sub-agent
+_BRIEF_TEMPLATE = """**Topic**: {topic}
+**Platform**: {platform}
+**Tone**: {tone}
+**Content Length**: {content_length}
+{ctx}
+Please ensure the content is:
+- Optimized for {platform}
+- Written in a {tone_lower} tone
+- Engaging and ready to post
+- Compliant with platform best practices"""
+
+# Per-agent task prompts; each is completed with the request brief
+_TASK_PROMPTS = {
+    "content_writer": (
+        "Write the main social media post for this request. "
+        "Respond with only the post content, ready to copy and paste.\n\n{brief}"
+    ),
+    "hashtag_specialist": (
+        "Create the hashtag strategy for this request. "
+        "Respond with only the hashtag recommendations and reasoning.\n\n{brief}"
+    ),
+    "visual_concept": (
+        "Suggest visual concepts for this request. "
+        "Respond with only the visual suggestions.\n\n{brief}"
+    ),
+    "analytics": (
+        "Provide performance insights and optimization tips for this request. "
+        "Respond with only the insights.\n\n{brief}"
+    ),
+}
+
+@lru_cache(maxsize=8)
+def _prompt_templates(include_hashtags: bool, include_visuals: bool,
+                      include_analytics: bool) -> Dict[str, str]:
+    """Pick the task prompts for an option combination, cached per combination"""
+    templates = {"content_writer": _TASK_PROMPTS["content_writer"]}
+
+    if include_hashtags:
+        templates["hashtag_specialist"] = _TASK_PROMPTS["hashtag_specialist"]
+
+    if include_visuals:
+        templates["visual_concept"] = _TASK_PROMPTS["visual_concept"]
+
+    if include_analytics:
+        templates["analytics"] = _TASK_PROMPTS["analytics"]
+
+    return templates
+
+@st.cache_data(ttl=86400, show_spinner=False, max_entries=1024, persist="disk")
+def _cached_generate(tasks_key: tuple, model_fingerprint: str, nonce: str = "",
+                     prompt_version: str = Config.PROMPT_VERSION) -> Dict[str, str]:
+    """
+    Run the agent fan-out for a prompt set, serving repeats from cache
+
+    Identical resubmissions within the TTL are answered without spending
+    any API quota; a fresh nonce bypasses the cache for forced regeneration.
+    Failed calls are retried with a short wait and never cached, so a
+    transient API error cannot poison the cache. The cache persists to
+    disk across restarts and is keyed on Config.PROMPT_VERSION so prompt
+    template changes invalidate it deliberately.
+    """
+    import time
+    from agents import FALLBACK_MARKER
+
+    tasks = dict(tasks_key)
+    results: Dict[str, str] = {}
+    pending = dict(tasks)
+
+    for attempt in range(3):
+        partial = _manager().run_parallel(pending)
+        pending = {
+            name: tasks[name] for name, text in partial.items()
+            if FALLBACK_MARKER in text
+        }
+        results.update({name: text for name, text in partial.items() if name not in pending})
+
+        if not pending:
+            return results
+
+        time.sleep(2 * (attempt + 1))
+
+    # Raise instead of returning fallback text so st.cache_data skips caching
+    raise RuntimeError(f"Generation failed for: {', '.join(sorted(pending))}")
+
+@st.cache_resource(show_spinner=False)
+def _stream_cache() -> Dict[tuple, str]:
+    """Process-wide store of completed streamed responses"""
+    return {}
+
+@st.cache_resource(show_spinner=False)
+def _agent_display_lines(manager_id: int) -> str:
+    """Build the sidebar agent list markdown once per agent-manager lifetime"""
+    agents = _manager().list_agents()
+    return "\n".join(
+        f"- {'🎯' if agent == 'coordinator' else '🤖'} {agent.replace('_', ' ').title()}"
+        for agent in agents
+    )
+
+@st.cache_data(show_spinner=False)
+def _all_platform_limits() -> Dict[str, Dict[str, int]]:
+    """Compute the limits for every supported platform once"""
+    return {p: get_platform_limits(p) for p in Config.SUPPORTED_PLATFORMS}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _check_internet() -> bool:
+    """Probe internet connectivity, reusing the result for 30 seconds"""
+    import requests
+    try:
+        # The 204 endpoint returns an empty body, so the probe is cheap
+        response = requests.get("https://clients3.google.com/generate_204", timeout=2)
+        return response.status_code in (200, 204)
+    except Exception:
+        return False
+
+@st.cache_data(show_spinner=False)
+def _footer_html(model_name: str) -> str:
+    """Build the footer HTML once per model name"""
+    return f"""
+    <div style='text-align: center; color: #666; margin-top: 2rem;'>
+        <p><strong>Social Media AI Agent</strong> - Built with Google Gemini API and Streamlit</p>
+        <p>Powered by {model_name} • Version 1.0.0</p>
+        <p>🤖 Multi-Agent System • 📱 Platform Optimized • 🎯 Engagement Focused</p>
+    </div>
+    """
+
 class SocialMediaApp:
     """
     Main application class for Social Media AI Agent
@@ -41,36 +262,28 @@ class SocialMediaApp:
         
     def _initialize_session_state(self):
         """Initialize Streamlit session state"""
-        if 'generated_content' not in st.session_state:
-            st.session_state.generated_content = []
-        
-        if 'agent_manager' not in st.session_state:
-            st.session_state.agent_manager = None
-            
-        if 'current_content' not in st.session_state:
-            st.session_state.current_content = None
-            
-        if 'show_history' not in st.session_state:
-            st.session_state.show_history = False
+        defaults = (
+            ("generated_content", deque(maxlen=200)),  # bounded history
+            ("content_index", {}),                     # content_id -> content for O(1) lookup
+            ("current_content", None),
+            ("show_history", False),
+        )
+
+        for key, value in defaults:
+            st.session_state.setdefault(key, value)
     
     def initialize_agents(self) -> bool:
         """Initialize the agent manager"""
         try:
-            if st.session_state.agent_manager is None:
-                with st.spinner("🤖 Initializing AI agents..."):
-                    st.session_state.agent_manager = get_agent_manager()
-                    self.agent_manager = st.session_state.agent_manager
-                    return True
-            else:
-                self.agent_manager = st.session_state.agent_manager
-                return True
+            self.agent_manager = _manager()
+            return True
         except Exception as e:
             st.error(f"Failed to initialize agents: {str(e)}")
             return False
     
     def validate_configuration(self) -> bool:
         """Validate application configuration"""
-        validation = self.config.validate_config()
+        validation = _cached_validate_config(_config_fingerprint(self.config.GOOGLE_API_KEY))
         missing = self.config.get_missing_config()
         
         if missing:
@@ -90,10 +303,8 @@ class SocialMediaApp:
                 
                 # Test API connection
                 if st.button("🔍 Test Gemini API"):
-                    from agents import test_gemini_connection
-                    
                     with st.spinner("Testing API connection..."):
-                        api_status = test_gemini_connection()
+                        api_status = _cached_test_gemini()
                     
                     if api_status["status"] == "success":
                         st.success(f"✅ {api_status['message']}")
@@ -118,17 +329,14 @@ class SocialMediaApp:
                 4. Restart the application
                 """)
             
-            st.markdown("---")
+            _sep()
             
             # Agent System Info
             st.markdown("### 🤖 Agent System")
             if self.agent_manager:
-                agents = self.agent_manager.list_agents()
                 st.markdown("**Active Agents:**")
-                for agent in agents:
-                    icon = "🎯" if agent == "coordinator" else "🤖"
-                    st.markdown(f"- {icon} {agent.replace('_', ' ').title()}")
-                
+                st.markdown(_agent_display_lines(id(self.agent_manager)))
+
                 # Agent status
                 if st.button("🔍 Check Agent Status"):
                     agent_info = self.agent_manager.get_agent_info()
@@ -147,7 +355,7 @@ class SocialMediaApp:
             else:
                 st.warning("Agents not initialized")
             
-            st.markdown("---")
+            _sep()
             
             # Model Information
             st.markdown("### 🧠 AI Models")
@@ -162,7 +370,7 @@ class SocialMediaApp:
             - No cost for usage (within free limits)
             """)
             
-            st.markdown("---")
+            _sep()
             
             # Free tier info
             st.markdown("### 🆓 Free Tier Limits")
@@ -175,7 +383,7 @@ class SocialMediaApp:
             **Tip**: Space out your generations to stay within limits
             """)
             
-            st.markdown("---")
+            _sep()
             
             # Platform limits info
             st.markdown("### 📊 Platform Limits")
@@ -185,12 +393,12 @@ class SocialMediaApp:
                 key="platform_limits_select"
             )
             
-            limits = get_platform_limits(platform_info)
+            limits = _all_platform_limits()[platform_info]
             st.markdown(f"**{platform_info} Limits:**")
             for content_type, limit in limits.items():
                 st.markdown(f"- {content_type.title()}: {limit:,} chars")
             
-            st.markdown("---")
+            _sep()
             
             # Tips and help
             st.markdown("### 💡 Tips")
@@ -210,7 +418,7 @@ class SocialMediaApp:
             - User-generated content
             """)
             
-            st.markdown("---")
+            _sep()
             
             # API Usage Info
             if self.config.GOOGLE_API_KEY:
@@ -225,7 +433,7 @@ class SocialMediaApp:
                 **Monitor usage**: Check Google AI Studio for usage stats
                 """)
             
-            st.markdown("---")
+            _sep()
             
             st.markdown("### 🔧 Troubleshooting")
             if st.button("🩺 Run Diagnostics", use_container_width=True):
@@ -243,15 +451,10 @@ class SocialMediaApp:
                 else:
                     st.error("❌ Agents not initialized")
                 
-                # Check internet (basic)
-                try:
-                    import requests
-                    response = requests.get("https://www.google.com", timeout=5)
-                    if response.status_code == 200:
-                        st.success("✅ Internet connection")
-                    else:
-                        st.warning("⚠️ Internet connection issues")
-                except:
+                # Check internet (basic, cached for 30s)
+                if _check_internet():
+                    st.success("✅ Internet connection")
+                else:
                     st.error("❌ No internet connection")
     
     def render_header(self):
@@ -275,8 +478,9 @@ class SocialMediaApp:
             with col4:
                 st.metric("Tone Options", len(self.config.TONE_OPTIONS))
     
+    @st.fragment
     def render_content_form(self):
-        """Render the content generation form"""
+        """Render the content generation form (fragment: reruns in isolation)"""
         st.markdown("## 📝 Content Creation")
         
         with st.form(key="content_form", clear_on_submit=False):
@@ -339,6 +543,12 @@ class SocialMediaApp:
                         index=1,
                         help="Preferred content length"
                     )
+
+                    force_regenerate = st.checkbox(
+                        "Force regenerate",
+                        value=False,
+                        help="Bypass the response cache and request fresh content"
+                    )
             
             # Submit button
             submitted = st.form_submit_button(
@@ -348,7 +558,7 @@ class SocialMediaApp:
             )
             
             if submitted:
-                return self.process_content_generation(
+                success = self.process_content_generation(
                     topic=topic,
                     platform=platform,
                     tone=tone,
@@ -356,15 +566,23 @@ class SocialMediaApp:
                     include_hashtags=include_hashtags,
                     include_visuals=include_visuals,
                     include_analytics=include_analytics,
-                    content_length=content_length
+                    content_length=content_length,
+                    force_regenerate=force_regenerate
                 )
-        
+
+                if success:
+                    # Escalate to a full rerun so the content display
+                    # fragment picks up the new content
+                    st.rerun()
+
+                return success
+
         return False
-    
-    def process_content_generation(self, topic: str, platform: str, tone: str, 
+
+    def process_content_generation(self, topic: str, platform: str, tone: str,
                                  additional_context: str, include_hashtags: bool,
                                  include_visuals: bool, include_analytics: bool,
-                                 content_length: str) -> bool:
+                                 content_length: str, force_regenerate: bool = False) -> bool:
         """Process content generation request"""
         
         # Validate input
@@ -382,7 +600,7 @@ class SocialMediaApp:
             st.session_state.current_content = None
         
         # Check platform limits
-        limits = get_platform_limits(platform)
+        limits = _all_platform_limits()[platform]
         
         # Generate content
         try:
@@ -395,9 +613,10 @@ class SocialMediaApp:
                     include_hashtags=include_hashtags,
                     include_visuals=include_visuals,
                     include_analytics=include_analytics,
-                    content_length=content_length
+                    content_length=content_length,
+                    force_regenerate=force_regenerate
                 )
-                
+
                 if result.get("success"):
                     # Store in session state
                     content_data = {
@@ -416,7 +635,15 @@ class SocialMediaApp:
                         }
                     }
                     
-                    st.session_state.generated_content.append(content_data)
+                    history = st.session_state.generated_content
+
+                    # Drop the entry the full deque is about to evict so the
+                    # index doesn't strand it for the life of the session
+                    if len(history) == history.maxlen:
+                        st.session_state.content_index.pop(history[0]["id"], None)
+
+                    history.append(content_data)
+                    st.session_state.content_index[content_data["id"]] = content_data
                     st.session_state.current_content = content_data
                     
                     st.success("✅ Content generated successfully!")
@@ -432,71 +659,107 @@ class SocialMediaApp:
     def generate_content(self, topic: str, platform: str, tone: str,
                         additional_context: str, include_hashtags: bool,
                         include_visuals: bool, include_analytics: bool,
-                        content_length: str) -> Dict:
+                        content_length: str, force_regenerate: bool = False) -> Dict:
         """Generate content using the agent system"""
         
         if not self.agent_manager:
             return {"success": False, "error": "Agent manager not initialized"}
-        
-        # Build comprehensive prompt
-        prompt_parts = [
-            f"Create a comprehensive social media content package for:",
-            f"",
-            f"**Topic**: {topic}",
-            f"**Platform**: {platform}",
-            f"**Tone**: {tone}",
-            f"**Content Length**: {content_length}",
-        ]
-        
-        if additional_context:
-            prompt_parts.append(f"**Additional Context**: {additional_context}")
-        
-        prompt_parts.extend([
-            f"",
-            f"**Requirements:**"
-        ])
-        
-        if include_hashtags:
-            prompt_parts.append("- Include comprehensive hashtag strategy")
-        
-        if include_visuals:
-            prompt_parts.append("- Provide creative visual concept suggestions")
-        
-        if include_analytics:
-            prompt_parts.append("- Include performance insights and optimization tips")
-        
-        prompt_parts.extend([
-            f"",
-            f"Please ensure the content is:",
-            f"- Optimized for {platform}",
-            f"- Written in a {tone.lower()} tone",
-            f"- Engaging and ready to post",
-            f"- Compliant with platform best practices",
-            f"- Includes current trends and insights"
-        ])
-        
-        prompt = "\n".join(prompt_parts)
-        
+
+        # Fill the pre-built brief template for this request
+        if force_regenerate:
+            import uuid
+            nonce = uuid.uuid4().hex
+        else:
+            nonce = ""
+
+        ctx = f"**Additional Context**: {additional_context}\n" if additional_context else ""
+
+        if nonce:
+            # Nudge the model toward a fresh take on the same request
+            ctx += f"(variation_seed={nonce[:6]})\n"
+
+        brief = _BRIEF_TEMPLATE.format(
+            topic=topic,
+            platform=platform,
+            tone=tone,
+            tone_lower=tone.lower(),
+            content_length=content_length,
+            ctx=ctx
+        )
+
+        # One focused prompt per sub-agent so the calls can run
+        # concurrently instead of one monolithic coordinator call
+        tasks = {
+            name: template.format(brief=brief)
+            for name, template in _prompt_templates(
+                include_hashtags, include_visuals, include_analytics
+            ).items()
+        }
+
         try:
-            # Get coordinator agent
-            coordinator = self.agent_manager.get_coordinator()
-            if not coordinator:
-                return {"success": False, "error": "Coordinator agent not available"}
-            
-            # Generate content
-            response = coordinator.run(prompt)
-            
+            # Stream the main post to the UI so first tokens appear in
+            # hundreds of ms instead of after the full generation; completed
+            # streams are teed into a cache so exact repeats skip the API
+            content_prompt = tasks.pop("content_writer")
+            stream_cache = _stream_cache()
+            stream_key = (content_prompt, self.config.DEFAULT_MODEL)
+
+            if not nonce and stream_key in stream_cache:
+                content_text = stream_cache[stream_key]
+            else:
+                writer = self.agent_manager.get_agent("content_writer")
+                content_text = st.write_stream(writer.run_stream(content_prompt))
+
+                from agents import FALLBACK_MARKER
+
+                # Only cache real content, and keep the store bounded
+                if FALLBACK_MARKER not in content_text:
+                    if len(stream_cache) >= 128:
+                        stream_cache.pop(next(iter(stream_cache)))
+                    stream_cache[stream_key] = content_text
+
+            # Fan the auxiliary prompts out concurrently; identical
+            # submissions are served from the response cache
+            results = _cached_generate(
+                tuple(tasks.items()), self.config.DEFAULT_MODEL, nonce,
+                self.config.PROMPT_VERSION
+            ) if tasks else {}
+            results["content_writer"] = content_text
+
+            response_parts = [
+                "## 📊 CONTENT PACKAGE SUMMARY",
+                f"- **Topic**: {topic}",
+                f"- **Platform**: {platform}",
+                f"- **Strategy**: {tone} {content_length.lower()}-form content for {platform}",
+                "",
+                "## 📝 CONTENT",
+                results["content_writer"],
+            ]
+
+            if include_hashtags:
+                response_parts.extend(["", "## 🏷️ HASHTAG STRATEGY", results["hashtag_specialist"]])
+
+            if include_visuals:
+                response_parts.extend(["", "## 🎨 VISUAL CONCEPTS", results["visual_concept"]])
+
+            if include_analytics:
+                response_parts.extend(["", "## 📈 PERFORMANCE INSIGHTS", results["analytics"]])
+
+            import time
+
             return {
                 "success": True,
-                "content": response,
-                "timestamp": datetime.now().isoformat()
+                "content": "\n".join(response_parts),
+                # Integer nanoseconds: cheaper to produce and to format later
+                "timestamp": time.time_ns()
             }
-            
+
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    @st.fragment
     def render_content_display(self):
-        """Render the generated content display"""
+        """Render the generated content display (fragment: reruns in isolation)"""
         
         if not st.session_state.current_content:
             st.info("👆 Generate content using the form above to see results here.")
@@ -535,7 +798,7 @@ class SocialMediaApp:
         st.markdown('<div class="result-card">', unsafe_allow_html=True)
         st.markdown("### 📝 Complete Content Package")
         
-        # Parse content
+        # Parse content (cached in utils so reruns skip the string parsing)
         parsed_content = parse_agent_response(content_data['content'])
         
         # Use tabs instead of expanders to avoid nesting issues
@@ -616,30 +879,10 @@ class SocialMediaApp:
         with col2:
             # Copy to clipboard - improved and simplified version
             if st.button("📋 Copy Content", use_container_width=True):
-                # Extract just the content part for copying
-                parsed_content = parse_agent_response(content_data['content'])
-                
-                # Create clean content for copying
-                if parsed_content['content']:
-                    copy_content = parsed_content['content']
-                else:
-                    # Fallback: extract content manually
-                    lines = content_data['content'].split('\n')
-                    content_lines = []
-                    in_content_section = False
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if '📝 CONTENT' in line.upper() or '## 📝' in line:
-                            in_content_section = True
-                            continue
-                        elif line.startswith('##') and in_content_section:
-                            break  # End of content section
-                        elif in_content_section and line:
-                            content_lines.append(line)
-                    
-                    copy_content = '\n'.join(content_lines).strip()
-                
+                # Reuse the parse from the top of this render; the content
+                # section is the canonical extraction of the post text
+                copy_content = parsed_content['content'] or content_data['content']
+
                 # Store in session state
                 st.session_state.copy_content = copy_content
                 
@@ -655,13 +898,37 @@ class SocialMediaApp:
                 )
         
         with col3:
-            # Regenerate content
+            # Regenerate the item being displayed; content_data carries the
+            # full original request, so history-restored items replay too
             if st.button("🔄 Regenerate", use_container_width=True):
-                st.session_state.current_content = None
-                st.rerun()
+                options = content_data.get('options', {})
+
+                success = self.process_content_generation(
+                    topic=content_data['topic'],
+                    platform=content_data['platform'],
+                    tone=content_data['tone'],
+                    additional_context=content_data.get('additional_context', ''),
+                    include_hashtags=options.get('include_hashtags', True),
+                    include_visuals=options.get('include_visuals', True),
+                    include_analytics=options.get('include_analytics', True),
+                    content_length=options.get('content_length', 'Medium'),
+                    force_regenerate=True
+                )
+
+                # Only rerun on success so a failure's st.error stays visible
+                if success:
+                    st.rerun()
     
+    @st.fragment
     def render_history(self):
-        """Render content generation history"""
+        """Render content generation history (fragment: reruns in isolation)"""
+        # Toggle lives inside the fragment so it doesn't rerun the whole app
+        if st.button("🗂️ Show/Hide Generation History"):
+            st.session_state.show_history = not st.session_state.get('show_history', False)
+
+        if not st.session_state.get('show_history', False):
+            return
+
         if not st.session_state.generated_content:
             st.info("No content generated yet. Create some content to see your history here!")
             return
@@ -676,7 +943,8 @@ class SocialMediaApp:
         
         with col2:
             if st.button("🗑️ Clear History"):
-                st.session_state.generated_content = []
+                st.session_state.generated_content.clear()
+                st.session_state.content_index.clear()
                 st.session_state.current_content = None
                 st.success("History cleared!")
                 st.rerun()
@@ -684,95 +952,52 @@ class SocialMediaApp:
         # Display history items in a simple list format
         st.markdown("### Recent Content")
         
-        for i, content in enumerate(reversed(st.session_state.generated_content[-5:])):  # Show last 5
+        for i, content in enumerate(islice(reversed(st.session_state.generated_content), 5)):  # Show last 5
             # Create a card-like display for each item
             with st.container():
-                st.markdown("---")
-                
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.markdown(f"**🎯 Topic**: {content['topic']}")
-                    st.markdown(f"**📱 Platform**: {content['platform']} | **🎵 Tone**: {content['tone']}")
-                    st.markdown(f"**⏰ Generated**: {format_timestamp(content['timestamp'])}")
-                    
-                    if content.get('additional_context'):
-                        st.markdown(f"**📋 Context**: {truncate_text(content['additional_context'], 100)}")
-                
-                with col2:
-                    if st.button(f"📖 View", key=f"view_{content['id']}", use_container_width=True):
-                        st.session_state.current_content = content
-                        st.rerun()
-        
-        # Show more button if there are more items
-        if len(st.session_state.generated_content) > 5:
-            if st.button(f"📜 Show All {len(st.session_state.generated_content)} Items"):
-                st.markdown("### All Generated Content")
-                
-                for i, content in enumerate(reversed(st.session_state.generated_content)):
-                    with st.container():
-                        st.markdown("---")
-                        col1, col2 = st.columns([4, 1])
-                        
-                        with col1:
-                            st.markdown(f"**{i+1}.** {truncate_text(content['topic'], 60)} ({content['platform']})")
-                            st.markdown(f"*{format_timestamp(content['timestamp'])}*")
-                        
-                        with col2:
-                            if st.button(f"View", key=f"view_all_{content['id']}", use_container_width=True):
-                                st.session_state.current_content = content
-                                st.rerun()
+                _sep()
+
+                # One markdown element per row keeps the frontend delta count low
+                body = (
+                    f"**🎯 Topic**: {content['topic']}\n\n"
+                    f"**📱 Platform**: {content['platform']} | **🎵 Tone**: {content['tone']}\n\n"
+                    f"**⏰ Generated**: {format_timestamp(content['timestamp'])}"
+                )
+
+                if content.get('additional_context'):
+                    body += f"\n\n**📋 Context**: {truncate_text(content['additional_context'], 100)}"
+
+                st.markdown(body)
+
+        # Single selector for all items instead of one button per row
+        st.markdown("### 📖 Open an Item")
+
+        content_index = st.session_state.content_index
+        history_ids = [content['id'] for content in reversed(st.session_state.generated_content)]
+
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            selected_id = st.selectbox(
+                "Open item",
+                options=history_ids,
+                format_func=lambda cid: (
+                    f"{truncate_text(content_index[cid]['topic'], 60)} ({content_index[cid]['platform']})"
+                ),
+                key="history_open_select",
+                label_visibility="collapsed"
+            )
+
+        with col2:
+            if st.button("📖 View", use_container_width=True) and selected_id:
+                st.session_state.current_content = content_index[selected_id]
+                st.rerun()
     
     def run(self):
         """Run the main application"""
         
         # Custom CSS
-        st.markdown("""
-        <style>
-            .main-header {
-                font-size: 3rem;
-                font-weight: bold;
-                text-align: center;
-                margin-bottom: 2rem;
-                background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-            }
-            
-            .agent-card {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 1.5rem;
-                border-radius: 15px;
-                color: white;
-                margin: 1rem 0;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-            }
-            
-            .result-card {
-                background: #f8f9fa;
-                padding: 1.5rem;
-                border-radius: 10px;
-                border-left: 4px solid #667eea;
-                margin: 1rem 0;
-            }
-            
-            .metrics-container {
-                display: flex;
-                justify-content: space-around;
-                margin: 2rem 0;
-            }
-            
-            .metric-item {
-                text-align: center;
-                padding: 1rem;
-            }
-            
-            .stAlert > div {
-                padding: 1rem;
-                border-radius: 8px;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        _inject_css()
         
         # Validate configuration
         if not self.validate_configuration():
@@ -796,25 +1021,12 @@ class SocialMediaApp:
         self.render_content_display()
         
         # History section - render directly without nesting in expander
-        st.markdown("---")
-        if st.button("🗂️ Show/Hide Generation History"):
-            if 'show_history' not in st.session_state:
-                st.session_state.show_history = True
-            else:
-                st.session_state.show_history = not st.session_state.show_history
-        
-        if st.session_state.get('show_history', False):
-            self.render_history()
+        _sep()
+        self.render_history()
         
         # Footer
-        st.markdown("---")
-        st.markdown(f"""
-        <div style='text-align: center; color: #666; margin-top: 2rem;'>
-            <p><strong>Social Media AI Agent</strong> - Built with Google Gemini API and Streamlit</p>
-            <p>Powered by {self.config.DEFAULT_MODEL} • Version 1.0.0</p>
-            <p>🤖 Multi-Agent System • 📱 Platform Optimized • 🎯 Engagement Focused</p>
-        </div>
-        """, unsafe_allow_html=True)
+        _sep()
+        st.markdown(_footer_html(self.config.DEFAULT_MODEL), unsafe_allow_html=True)
 
 
 def main():
@@ -3,11 +3,20 @@ Simplified Configuration module for Social Media AI Agent
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
-from dotenv import load_dotenv
+
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load .env variables exactly once per process"""
+    # dotenv is imported here so the module cost is only paid when the
+    # environment is actually resolved
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
 
 # Load environment variables from .env file
-load_dotenv()
+_load_env()
 
 class Config:
     """Application configuration class"""
@@ -21,6 +30,10 @@ class Config:
     # Model Configuration
     DEFAULT_MODEL: str = "gemini-1.5-flash"  # Free model
     FALLBACK_MODEL: str = "gemini-1.5-flash"
+
+    # Bump manually whenever the prompt templates change so persisted
+    # response caches are invalidated deliberately
+    PROMPT_VERSION: str = "v1"
     
     # Agent Configuration
     MAX_TOKENS: int = 8192
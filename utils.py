@@ -4,11 +4,86 @@ Simplified Utility functions for Social Media AI Agent
 
 import json
 import re
+import string
 import streamlit as st
 from datetime import datetime
 from typing import Dict, List, Tuple, Any
 import hashlib
 
+# Optional fast JSON encoder; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Precompiled patterns so hot helpers skip the re-cache lookup per call
+_WS_RE = re.compile(r'\s+')
+_ALLOWED_RE = re.compile(r'[^\w\s\-.,!?@#$%&*()+=\[\]{}:;"\'<>/\\|`~]')
+_HASHTAG_RE = re.compile(r'#\w+')
+_TAG_CLEAN_RE = re.compile(r'[^a-zA-Z0-9_]')
+_FNSAFE_RE = re.compile(r'[^\w\s-]')
+_DASH_RE = re.compile(r'[-\s]+')
+
+# Translation table deleting disallowed ASCII chars; a single C-level
+# table lookup per char, much cheaper than the regex char-class scan
+_ALLOWED_CHARS = set(string.ascii_letters + string.digits + ' \t\n\r'
+                     + '-.,!?@#$%&*()+=[]{}:;"\'<>/\\|`~_')
+_CLEAN_TRANS = {i: None for i in range(128) if chr(i) not in _ALLOWED_CHARS}
+
+# Single alternation covering all section headers; the matching named group
+# tells parse_agent_response which section a line starts
+_SECTION_RE = re.compile(
+    r'(?P<summary>📊 content package|content package summary|## 📊)'
+    r'|(?P<content>📝 content|## 📝|post content)'
+    r'|(?P<hashtags>🏷️ hashtag|hashtag strategy|## 🏷️)'
+    r'|(?P<visual_concepts>🎨 visual|visual concept|## 🎨)'
+    r'|(?P<analytics>📈 performance|analytics|insights|## 📈)'
+    r'|(?P<trends>🔥 trend|trending element|## 🔥)'
+)
+
+# Valid options as frozensets for O(1) membership checks
+_VALID_PLATFORMS = frozenset(["Instagram", "Twitter/X", "LinkedIn", "Facebook", "TikTok", "YouTube", "General"])
+_VALID_TONES = frozenset(["Professional", "Casual", "Inspiring", "Educational", "Humorous", "Urgent", "Friendly"])
+
+# Character limits per platform, built once at import
+_PLATFORM_LIMITS = {
+    "Instagram": {
+        "caption": 2200,
+        "bio": 150,
+        "hashtags": 30
+    },
+    "Twitter/X": {
+        "post": 280,
+        "bio": 160,
+        "hashtags": 2
+    },
+    "LinkedIn": {
+        "post": 3000,
+        "headline": 220,
+        "hashtags": 5
+    },
+    "Facebook": {
+        "post": 63206,
+        "bio": 101,
+        "hashtags": 30
+    },
+    "TikTok": {
+        "caption": 2200,
+        "bio": 80,
+        "hashtags": 5
+    },
+    "YouTube": {
+        "description": 5000,
+        "title": 100,
+        "hashtags": 15
+    },
+    "General": {
+        "post": 2000,
+        "bio": 150,
+        "hashtags": 10
+    }
+}
+
 def validate_input(topic: str, platform: str, tone: str) -> Tuple[bool, str]:
     """
     Validate user input for content generation
@@ -21,21 +96,22 @@ def validate_input(topic: str, platform: str, tone: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not topic or not topic.strip():
+    stripped_topic = topic.strip() if topic else ""
+    topic_length = len(stripped_topic)
+
+    if not stripped_topic:
         return False, "Topic cannot be empty"
-    
-    if len(topic.strip()) < 3:
+
+    if topic_length < 3:
         return False, "Topic must be at least 3 characters long"
-    
-    if len(topic.strip()) > 500:
+
+    if topic_length > 500:
         return False, "Topic must be less than 500 characters"
     
-    valid_platforms = ["Instagram", "Twitter/X", "LinkedIn", "Facebook", "TikTok", "YouTube", "General"]
-    if platform not in valid_platforms:
+    if platform not in _VALID_PLATFORMS:
         return False, "Invalid platform selected"
-    
-    valid_tones = ["Professional", "Casual", "Inspiring", "Educational", "Humorous", "Urgent", "Friendly"]
-    if tone not in valid_tones:
+
+    if tone not in _VALID_TONES:
         return False, "Invalid tone selected"
     
     return True, ""
@@ -54,13 +130,18 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove special characters that might cause issues
-    text = re.sub(r'[^\w\s\-.,!?@#$%&*()+=\[\]{}:;"\'<>/\\|`~]', '', text)
-    
+    text = _WS_RE.sub(' ', text.strip())
+
+    # Remove special characters that might cause issues; ASCII text takes
+    # the branchless translate fast path
+    if text.isascii():
+        text = text.translate(_CLEAN_TRANS)
+    else:
+        text = _ALLOWED_RE.sub('', text)
+
     return text
 
+@st.cache_data(max_entries=512, show_spinner=False)
 def format_hashtags(hashtags: str) -> List[str]:
     """
     Format and validate hashtags
@@ -74,19 +155,12 @@ def format_hashtags(hashtags: str) -> List[str]:
     if not hashtags:
         return []
     
-    # Extract hashtags using regex
-    hashtag_pattern = r'#\w+'
-    found_hashtags = re.findall(hashtag_pattern, hashtags)
-    
-    # Clean and format
-    formatted = []
-    for tag in found_hashtags:
-        # Remove # if present, clean, and add back
-        clean_tag = re.sub(r'[^a-zA-Z0-9_]', '', tag.replace('#', ''))
-        if clean_tag and len(clean_tag) > 1:
-            formatted.append(f"#{clean_tag}")
-    
-    return list(set(formatted))  # Remove duplicates
+    # Extract, clean and dedupe in one pass, preserving first-seen order
+    return list(dict.fromkeys(
+        f"#{clean_tag}"
+        for tag in _HASHTAG_RE.findall(hashtags)
+        if len(clean_tag := _TAG_CLEAN_RE.sub('', tag[1:])) > 1
+    ))
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
@@ -121,22 +195,31 @@ def generate_content_id(topic: str, platform: str, timestamp: datetime = None) -
         timestamp = datetime.now()
     
     content_string = f"{topic}_{platform}_{timestamp.isoformat()}"
-    return hashlib.md5(content_string.encode()).hexdigest()[:12]
+    # blake2b with a 6-byte digest yields exactly 12 hex chars and is
+    # faster than hashing 16 bytes with md5 and slicing
+    return hashlib.blake2b(content_string.encode(), digest_size=6).hexdigest()
 
-def format_timestamp(timestamp: str) -> str:
+def format_timestamp(timestamp) -> str:
     """
     Format timestamp for display
-    
+
     Args:
-        timestamp: ISO format timestamp
-        
+        timestamp: Integer nanoseconds since the epoch, or ISO format string
+
     Returns:
         Formatted timestamp string
     """
+    if isinstance(timestamp, int):
+        dt = datetime.fromtimestamp(timestamp / 1_000_000_000)
+        return dt.isoformat(sep=' ', timespec='seconds')
+
+    # Only allocate a new string when a trailing 'Z' actually needs replacing
+    s = timestamp[:-1] + '+00:00' if timestamp.endswith('Z') else timestamp
+
     try:
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
+        # isoformat is a pure C method, ~2x faster than strftime
+        return datetime.fromisoformat(s).isoformat(sep=' ', timespec='seconds')
+    except ValueError:
         return timestamp
 
 def export_content_json(content_data: Dict[str, Any]) -> str:
@@ -149,12 +232,12 @@ def export_content_json(content_data: Dict[str, Any]) -> str:
     Returns:
         Formatted JSON string
     """
-    try:
-        return json.dumps(content_data, indent=2, ensure_ascii=False)
-    except Exception as e:
-        st.error(f"Error exporting content: {str(e)}")
-        return "{}"
+    if orjson is not None:
+        return orjson.dumps(content_data, option=orjson.OPT_INDENT_2).decode()
+
+    return json.dumps(content_data, indent=2, ensure_ascii=False)
 
+@st.cache_data(max_entries=512, show_spinner=False)
 def parse_agent_response(response: str) -> Dict[str, str]:
     """
     Parse agent response into structured sections
@@ -165,59 +248,52 @@ def parse_agent_response(response: str) -> Dict[str, str]:
     Returns:
         Dictionary with parsed sections
     """
-    sections = {
-        "summary": "",
-        "content": "",
-        "hashtags": "",
-        "visual_concepts": "",
-        "analytics": "",
-        "trends": ""
+    # Accumulate lines per section and join once at the end; repeated
+    # str += is quadratic on long responses
+    buf: Dict[str, List[str]] = {
+        "summary": [],
+        "content": [],
+        "hashtags": [],
+        "visual_concepts": [],
+        "analytics": [],
+        "trends": []
     }
-    
-    # Split response by lines
-    lines = response.split('\n')
+
+    # Hoist lookups out of the loop; this runs for every line of every
+    # agent response, so interpreter overhead matters
     current_section = "summary"
-    
-    for line in lines:
+    current = buf[current_section]
+    search = _SECTION_RE.search
+
+    for line in response.split('\n'):
         line = line.strip()
-        
+
         # Skip empty lines
         if not line:
             continue
-        
-        # Check for section headers (more comprehensive)
-        line_lower = line.lower()
-        
-        if any(header in line_lower for header in ["📊 content package", "content package summary", "## 📊"]):
-            current_section = "summary"
-            continue
-        elif any(header in line_lower for header in ["📝 content", "## 📝", "post content"]):
-            current_section = "content"
-            continue
-        elif any(header in line_lower for header in ["🏷️ hashtag", "hashtag strategy", "## 🏷️"]):
-            current_section = "hashtags"
-            continue
-        elif any(header in line_lower for header in ["🎨 visual", "visual concept", "## 🎨"]):
-            current_section = "visual_concepts"
-            continue
-        elif any(header in line_lower for header in ["📈 performance", "analytics", "insights", "## 📈"]):
-            current_section = "analytics"
-            continue
-        elif any(header in line_lower for header in ["🔥 trend", "trending element", "## 🔥"]):
-            current_section = "trends"
+
+        # Check for section headers with one pass of the compiled alternation
+        header_match = search(line.lower())
+
+        if header_match:
+            current_section = header_match.lastgroup
+            current = buf[current_section]
             continue
-        else:
-            # Add content to current section, skip section headers
-            if not line.startswith('##') and not line.startswith('**') or current_section == "content":
-                # For content section, include everything except clear headers
-                if current_section == "content" and line.startswith('##'):
-                    continue
-                sections[current_section] += line + "\n"
-    
+
+        # Add content to current section, skip section headers
+        is_header = line.startswith('##')
+
+        if current_section == "content":
+            # For content section, include everything except clear headers
+            if not is_header:
+                current.append(line)
+        elif not is_header and not line.startswith('**'):
+            current.append(line)
+
     # Clean up sections
+    sections = {key: "\n".join(value).strip() for key, value in buf.items()}
+
     for key in sections:
-        sections[key] = sections[key].strip()
-        
         # Special cleaning for content section
         if key == "content" and sections[key]:
             # Remove any remaining headers that slipped through
@@ -257,18 +333,20 @@ def display_agent_status(agent_info: Dict[str, Dict[str, Any]]) -> None:
         agent_info: Agent information dictionary
     """
     st.markdown("### 🤖 Agent Status")
-    
-    for name, info in agent_info.items():
-        with st.expander(f"📋 {info['name'].replace('_', ' ').title()}"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write(f"**Description:** {info['description']}")
-                st.write(f"**Model:** {info['model']}")
-            
-            with col2:
-                st.write(f"**Has Tools:** {'✅' if info['has_tools'] else '❌'}")
-                st.write(f"**Has Sub-agents:** {'✅' if info['has_sub_agents'] else '❌'}")
+
+    # One dataframe element instead of ~5 frontend elements per agent
+    rows = [
+        {
+            "Name": info['name'],
+            "Description": info['description'],
+            "Model": info['model'],
+            "Tools": "✅" if info['has_tools'] else "❌",
+            "Sub-agents": "✅" if info['has_sub_agents'] else "❌"
+        }
+        for info in agent_info.values()
+    ]
+
+    st.dataframe(rows, use_container_width=True, hide_index=True)
 
 def create_download_filename(topic: str, platform: str, file_type: str = "json") -> str:
     """
@@ -283,8 +361,8 @@ def create_download_filename(topic: str, platform: str, file_type: str = "json")
         Safe filename
     """
     # Clean topic for filename
-    safe_topic = re.sub(r'[^\w\s-]', '', topic).strip()
-    safe_topic = re.sub(r'[-\s]+', '-', safe_topic)[:30]
+    safe_topic = _FNSAFE_RE.sub('', topic).strip()
+    safe_topic = _DASH_RE.sub('-', safe_topic)[:30]
     
     # Clean platform name
     safe_platform = platform.replace('/', '_').lower()
@@ -304,46 +382,9 @@ def get_platform_limits(platform: str) -> Dict[str, int]:
     Returns:
         Dictionary with character limits
     """
-    limits = {
-        "Instagram": {
-            "caption": 2200,
-            "bio": 150,
-            "hashtags": 30
-        },
-        "Twitter/X": {
-            "post": 280,
-            "bio": 160,
-            "hashtags": 2
-        },
-        "LinkedIn": {
-            "post": 3000,
-            "headline": 220,
-            "hashtags": 5
-        },
-        "Facebook": {
-            "post": 63206,
-            "bio": 101,
-            "hashtags": 30
-        },
-        "TikTok": {
-            "caption": 2200,
-            "bio": 80,
-            "hashtags": 5
-        },
-        "YouTube": {
-            "description": 5000,
-            "title": 100,
-            "hashtags": 15
-        },
-        "General": {
-            "post": 2000,
-            "bio": 150,
-            "hashtags": 10
-        }
-    }
-    
-    return limits.get(platform, limits["General"])
+    return _PLATFORM_LIMITS.get(platform, _PLATFORM_LIMITS["General"])
 
+@st.cache_data(max_entries=512, show_spinner=False)
 def validate_content_length(content: str, platform: str, content_type: str = "post") -> Tuple[bool, str]:
     """
     Validate content length against platform limits
@@ -398,4 +439,5 @@ def character_count(text: str, include_spaces: bool = True) -> int:
     if include_spaces:
         return len(text)
     else:
-        return len(text.replace(' ', ''))
\ No newline at end of file
+        # Count in place instead of allocating a stripped copy
+        return len(text) - text.count(' ')
\ No newline at end of file